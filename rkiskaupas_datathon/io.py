@@ -1,22 +1,15 @@
+import os
+
 import geopandas as gpd
+import requests
 
 
-def update_wfs(filename: str):
+def wfs_request_url():
     '''
-    Fetches the latest road data from a Web Feature Service (WFS) and saves it as a GeoJSON file.
-
-    The function connects to the WFS service provided by gis.lmi.is, requests the road data, 
-    and saves it to a local GeoJSON file.
-
-    Parameters:
-    - filename (str): The path and name of the GeoJSON file to save the road data to.
+    Builds the Web Feature Service (WFS) request URL for the road data.
 
     Returns:
-    None. The function saves the road data to the specified GeoJSON file.
-
-    Example:
-    >>> update_wfs("roads_data.geojson")
-    This will save the road data to a file named "roads_data.geojson" in the current directory.
+    str. A GetFeature URL for the IS_50V:samgongur_linur layer on gis.lmi.is, returning GeoJSON.
     '''
 
     # 1. Connect to the WFS service
@@ -30,10 +23,80 @@ def update_wfs(filename: str):
         "typeName": "IS_50V:samgongur_linur",
         "outputFormat": "application/json"
     }
-    request_url = wfs_url + "&".join([f"{k}={v}" for k, v in params.items()])
+    return wfs_url + "&".join([f"{k}={v}" for k, v in params.items()])
+
+
+def read_wfs(request_url: str = None):
+    '''
+    Reads the latest road data from the WFS straight into a GeoDataFrame.
+
+    No file is written, so the data is parsed only once.
+
+    Parameters:
+    - request_url (str, optional): GetFeature URL to read. Defaults to `wfs_request_url()`.
+
+    Returns:
+    GeoDataFrame. The road lines with their attributes, in the CRS served by the WFS.
+    '''
+    if request_url is None:
+        request_url = wfs_request_url()
+    return gpd.read_file(request_url, engine="pyogrio", use_arrow=True)
+
+
+def update_wfs(filename: str):
+    '''
+    Fetches the latest road data from a Web Feature Service (WFS) and saves it to a file.
+
+    The function connects to the WFS service provided by gis.lmi.is, requests the road data,
+    and streams the response to disk. GeoJSON targets receive the response as is; any other
+    extension (e.g. ".fgb" for FlatGeobuf) is converted once so later loads read a binary format.
+    The target must be a single-file format; it is only replaced once the new data is complete.
+
+    Parameters:
+    - filename (str or os.PathLike): The path and name of the file to save the road data to.
+
+    Returns:
+    None. The function saves the road data to the specified file.
+
+    Example:
+    >>> update_wfs("roads_data.fgb")
+    This will save the road data to a FlatGeobuf file named "roads_data.fgb" in the current directory.
+    '''
+
+    filename = os.fspath(filename)
 
-    # 3. Retrieve the road data as a GeoDataFrame
-    gdf = gpd.read_file(request_url)
+    # 1. Stream the GeoJSON response to a temporary file first so a failed
+    #    download never leaves a truncated file behind
+    tmp_filename = filename + ".part.geojson"
+    root, ext = os.path.splitext(filename)
+    tmp_converted = root + ".part" + ext
+    try:
+        with requests.get(wfs_request_url(), stream=True) as response:
+            response.raise_for_status()
+            with open(tmp_filename, "wb") as file:
+                head = b""
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    # 2. Make sure the body is GeoJSON and not e.g. an XML
+                    #    exception report served with status 200
+                    if not head:
+                        head = chunk.lstrip()[:1]
+                        if head and head != b"{":
+                            raise ValueError(
+                                "WFS response is not GeoJSON (Content-Type: "
+                                f"{response.headers.get('Content-Type')})")
+                    file.write(chunk)
+                if not head:
+                    raise ValueError("WFS response is empty")
 
-    # 4. Save the GeoDataFrame to a GeoJSON file
-    gdf.to_file(filename, driver="GeoJSON")
+        # 3. Move GeoJSON into place; convert anything else by its extension
+        #    next to the target and move that into place
+        if filename.lower().endswith((".geojson", ".json")):
+            os.replace(tmp_filename, filename)
+        else:
+            gdf = gpd.read_file(tmp_filename, engine="pyogrio", use_arrow=True)
+            gdf.to_file(tmp_converted, engine="pyogrio")
+            os.replace(tmp_converted, filename)
+    finally:
+        for path in (tmp_filename, tmp_converted):
+            if os.path.exists(path):
+                os.remove(path)
@@ -1,14 +1,47 @@
-import json
+from functools import lru_cache
 
 import contextily as ctx
 import geopandas as gpd
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import networkx as nx
+from networkx.algorithms.approximation import steiner_tree
 import numpy as np
+import orjson
 import pyproj
+import shapely
 from scipy.interpolate import griddata
-from shapely.geometry import LineString, MultiLineString, Point
-from shapely.ops import nearest_points, transform
+from shapely.geometry import LineString, Point
+
+from .io import read_wfs
+
+
+@lru_cache(maxsize=32)
+def _get_transformer(src, dst):
+    """Return a cached transformer between two CRS definitions."""
+    return pyproj.Transformer.from_crs(src, dst, always_xy=True)
+
+
+def _to_web_mercator(gdf):
+    """Return the GeoDataFrame in EPSG:3857, reprojected via a cached transformer."""
+    if gdf.crs is None:
+        raise ValueError("Cannot transform naive geometries. "
+                         "Please set a crs on the object first.")
+    if gdf.crs == "EPSG:3857":
+        return gdf
+
+    # Transform all vertices in one call; Z (if any) is carried through as is
+    transformer = _get_transformer(gdf.crs.to_string(), "EPSG:3857")
+
+    def project(coords):
+        xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack((xs, ys, coords[:, 2:]))
+
+    geometries = shapely.transform(np.asarray(gdf.geometry.values),
+                                   project,
+                                   include_z=True)
+
+    return gdf.set_geometry(geometries, crs="EPSG:3857")
 
 
 class RoadMap(nx.Graph):
@@ -21,6 +54,11 @@ class RoadMap(nx.Graph):
         'Landsvegur': 'National Road',
         'Stofnvegur um hálendið': 'Highland Main Road'
     }
+    # Columns copied from traffic counter points onto the nearest road
+    TRAFFIC_COLUMNS = [
+        'UMF_15MIN', 'UMF_I_DAG', 'UMF_DAGUR1', 'UMF_DAGUR2', 'UMF_DAGUR3',
+        'UMF_DAGUR4', 'UMF_DAGUR5', 'UMF_DAGUR6', 'UMF_DAGUR7'
+    ]
     # Iceland's bounding box coordinates in Web Mercator projection
     ICELAND_BOUNDS = {
         "xmin": -2800000,
@@ -30,10 +68,192 @@ class RoadMap(nx.Graph):
     }
 
     def __init__(self, incoming_graph_data=None, **attr):
+        # Columnar view of the edges (and their STRtree), built lazily
+        self._edge_columns = None
         super().__init__(incoming_graph_data, **attr)
 
+    # Every structural change drops the cached edge columns
+    def add_node(self, node_for_adding, **attr):
+        super().add_node(node_for_adding, **attr)
+        self._edge_columns = None
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        super().add_nodes_from(nodes_for_adding, **attr)
+        self._edge_columns = None
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+        self._edge_columns = None
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        super().add_edges_from(ebunch_to_add, **attr)
+        self._edge_columns = None
+
+    def remove_edge(self, u, v):
+        super().remove_edge(u, v)
+        self._edge_columns = None
+
+    def remove_edges_from(self, ebunch):
+        super().remove_edges_from(ebunch)
+        self._edge_columns = None
+
+    def remove_node(self, n):
+        super().remove_node(n)
+        self._edge_columns = None
+
+    def remove_nodes_from(self, nodes):
+        super().remove_nodes_from(nodes)
+        self._edge_columns = None
+
+    def clear(self):
+        super().clear()
+        self._edge_columns = None
+
+    def clear_edges(self):
+        super().clear_edges()
+        self._edge_columns = None
+
+    def _ensure_edge_columns(self):
+        """
+        Return a columnar view of the edges, building it if needed.
+
+        The view is a dict of parallel per-edge arrays:
+        - 'nodes': list of all nodes, in graph order.
+        - 'edges': list of (u, v) node pairs.
+        - 'uv': int64 array (E, 2) of indices into 'nodes'.
+        - 'geometries': object array of edge geometries.
+        - 'road_type_id': int16 array of indices into 'road_type_names'.
+        - 'road_type_names': list of distinct road types, in first-seen order.
+
+        It is rebuilt after edges or nodes are added or removed; replacing an
+        edge's 'geometry' or 'road_type' in place is not tracked.
+        """
+        if self._edge_columns is None:
+            nodes = list(self.nodes())
+            node_idx = {node: i for i, node in enumerate(nodes)}
+            edges = list(self.edges(data=True))
+
+            uv = np.array([(node_idx[u], node_idx[v]) for u, v, _ in edges],
+                          dtype=np.int64).reshape(-1, 2)
+            geometries = np.array(
+                [data.get('geometry') for _, _, data in edges], dtype=object)
+
+            # Dictionary-encode road types as small integer codes
+            road_type_idx = {}
+            road_type_id = [
+                road_type_idx.setdefault(data.get('road_type'),
+                                         len(road_type_idx))
+                for _, _, data in edges
+            ]
+
+            self._edge_columns = {
+                'nodes': nodes,
+                'edges': [(u, v) for u, v, _ in edges],
+                'uv': uv,
+                'geometries': geometries,
+                'road_type_id': np.array(road_type_id, dtype=np.int16),
+                'road_type_names': list(road_type_idx),
+            }
+
+        return self._edge_columns
+
     def save(self, filename):
-        """Save the RoadMap to a file using JSON."""
+        """
+        Save the RoadMap to a file.
+
+        Files ending in '.npz' use a compressed columnar NumPy archive; any
+        other name is written in the nested JSON format, as before.
+        """
+        if str(filename).endswith('.npz'):
+            self._save_npz(filename)
+        else:
+            self._save_json(filename)
+
+    @classmethod
+    def load(cls, filename):
+        """Load a RoadMap saved with `save`, choosing the format by extension."""
+        if str(filename).endswith('.npz'):
+            return cls._load_npz(filename)
+        return cls._load_json(filename)
+
+    def _save_npz(self, filename):
+        """Save the RoadMap as parallel arrays in a compressed .npz file."""
+        columns = self._ensure_edge_columns()
+        geometries = columns['geometries']
+
+        # All edge vertices in one (M, 3) array, sliced per edge by the
+        # offsets; 2D lines get NaN for z and are flagged by has_z
+        coords = shapely.get_coordinates(geometries, include_z=True)
+        has_z = shapely.has_z(geometries)
+        coord_offsets = np.concatenate(
+            ([0], np.cumsum(shapely.get_num_coordinates(geometries))))
+
+        # Remaining attributes (e.g. traffic) are kept as a single JSON blob;
+        # as in the JSON format, NaN values are stored as null
+        extra_attrs = [{
+            k: val
+            for k, val in self[u][v].items()
+            if k not in ('geometry', 'road_type')
+        } for u, v in columns['edges']]
+        extra_attrs_json = orjson.dumps(
+            extra_attrs, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+        np.savez_compressed(
+            filename,
+            nodes=np.array(columns['nodes'], dtype=np.float64).reshape(-1, 2),
+            edges=columns['uv'],
+            coords=coords,
+            coord_offsets=coord_offsets,
+            has_z=has_z,
+            road_type_ids=columns['road_type_id'],
+            road_type_names=np.array(
+                orjson.dumps(columns['road_type_names']).decode()),
+            extra_attrs=np.array(extra_attrs_json))
+
+    @classmethod
+    def _load_npz(cls, filename):
+        """Load a RoadMap from a .npz file written by `save`."""
+        with np.load(filename) as data:
+            nodes = list(map(tuple, data['nodes'].tolist()))
+            edges = data['edges']
+            coords = data['coords']
+            coord_offsets = data['coord_offsets']
+            has_z = data['has_z']
+            road_type_ids = data['road_type_ids']
+            road_type_names = orjson.loads(data['road_type_names'].item())
+            extra_attrs = orjson.loads(data['extra_attrs'].item())
+
+        # Rebuild the 3D and the 2D LineStrings in one call each; edges
+        # without vertices get None
+        num_coords = np.diff(coord_offsets)
+        vertex_has_z = np.repeat(has_z, num_coords)
+        geometries = np.full(len(edges), None, dtype=object)
+        for mask, vertices in ((has_z, coords[vertex_has_z]),
+                               (~has_z, coords[~vertex_has_z, :2])):
+            mask = mask & (num_coords > 0)
+            geometries[mask] = shapely.linestrings(
+                vertices,
+                indices=np.repeat(np.arange(mask.sum()), num_coords[mask]))
+
+        road_types = [road_type_names[i] for i in road_type_ids.tolist()]
+
+        G = cls()
+        G.add_nodes_from(nodes)
+        G.add_edges_from((nodes[u], nodes[v], {
+            **attrs, 'geometry': geometry,
+            'road_type': road_type
+        }) for (u, v), geometry, road_type, attrs in zip(
+            edges.tolist(), geometries, road_types, extra_attrs))
+
+        return G
+
+    def _save_json(self, filename):
+        """
+        Save the RoadMap to a file using JSON.
+
+        Written with orjson, which stores NaN attribute values (e.g. missing
+        traffic counts) as null, so they load back as None.
+        """
         adjacency_data = nx.to_dict_of_dicts(self)
 
         # Convert LineString to list of coordinates and tuple keys to strings
@@ -41,24 +261,28 @@ class RoadMap(nx.Graph):
             str(k): {
                 str(inner_key): {
                     **val, 'geometry':
-                    list(val['geometry'].coords) if 'geometry' in val else None
+                    shapely.get_coordinates(
+                        val['geometry'],
+                        include_z=val['geometry'].has_z).tolist()
+                    if val.get('geometry') is not None else None
                 }
                 for inner_key, val in v.items()
             }
             for k, v in adjacency_data.items()
         }
 
-        with open(filename, 'w') as file:
-            json.dump(adjacency_data_str_keys, file)
+        with open(filename, 'wb') as file:
+            file.write(
+                orjson.dumps(adjacency_data_str_keys,
+                             option=orjson.OPT_SERIALIZE_NUMPY))
 
     @classmethod
-    def load(cls, filename):
+    def _load_json(cls, filename):
         """Load a RoadMap from a file using JSON."""
-        with open(filename, 'r') as file:
-            adjacency_data_str_keys = json.load(file)
+        with open(filename, 'rb') as file:
+            adjacency_data_str_keys = orjson.loads(file.read())
 
         # Convert string keys back to tuples for nodes and list of coordinates to LineString
-        from shapely.geometry import LineString
         adjacency_data = {
             (float(k.replace("(", "").replace(")", "").split(',')[0].strip()),
              float(k.replace("(", "").replace(")", "").split(',')[1].strip())):
@@ -70,7 +294,8 @@ class RoadMap(nx.Graph):
                      inner_key.replace("(", "").replace(")", "").split(',')[1].strip(
                      ))): {
                     **val, 'geometry':
-                    LineString(val['geometry']) if val['geometry'] else None
+                    LineString(np.asarray(val['geometry']))
+                    if val['geometry'] else None
                 }
                 for inner_key, val in v.items()
             }
@@ -81,85 +306,122 @@ class RoadMap(nx.Graph):
 
     @classmethod
     def load_from_wfs(cls, filename):
-        """Load a RoadMap from a GeoJSON file."""
-        gdf = gpd.read_file(filename).to_crs("EPSG:3857")
-        G = cls()
+        """Load a RoadMap from a road data file saved by `update_wfs`."""
+        return cls.from_gdf(
+            gpd.read_file(filename, engine='pyogrio', use_arrow=True))
 
-        # Function to handle both LineString and MultiLineString geometries
-        def add_edges_from_geometry(G, geometry, road_type):
-            if isinstance(geometry, LineString):
-                start_point = geometry.coords[0]
-                end_point = geometry.coords[-1]
-                G.add_node(start_point)
-                G.add_node(end_point)
-                # Translate Icelandic road type to English
-                translated_road_type = cls.TRANSLATION_DICT.get(
-                    road_type, road_type)
-                G.add_edge(start_point,
-                           end_point,
-                           geometry=geometry,
-                           road_type=translated_road_type)
-            elif isinstance(geometry, MultiLineString):
-                for line in geometry.geoms:
-                    add_edges_from_geometry(G, line, road_type)
-
-        # Iterate over the GeoDataFrame to add edges to the graph
-        for index, row in gdf.iterrows():
-            # Adjust this based on the exact column name for road type
-            road_type = row['vegflokkun_text_is']
-            add_edges_from_geometry(G, row['geometry'], road_type)
+    @classmethod
+    def from_wfs(cls, request_url=None):
+        """Load a RoadMap straight from the WFS, without a file on disk."""
+        return cls.from_gdf(read_wfs(request_url))
+
+    @classmethod
+    def from_gdf(cls, gdf):
+        """Build a RoadMap from a GeoDataFrame of road lines."""
+        gdf = _to_web_mercator(gdf)
+
+        # Flatten MultiLineStrings into their LineString parts
+        gdf = gdf[gdf.geom_type.isin(['LineString', 'MultiLineString'])]
+        gdf = gdf.explode(index_parts=False)
+        gdf = gdf[~gdf.is_empty]
+        geometries = gdf.geometry.values
+
+        # Locate the first and last vertex of every line in the flat array.
+        # Nodes are keyed on (x, y) only, so roads meeting in plan view are
+        # connected whatever their Z; the edge geometries keep Z.
+        coords = shapely.get_coordinates(geometries)
+        num_coords = shapely.get_num_coordinates(geometries)
+        offsets = np.cumsum(num_coords)
+        start_points = map(tuple, coords[offsets - num_coords].tolist())
+        end_points = map(tuple, coords[offsets - 1].tolist())
+
+        # Translate Icelandic road types to English
+        road_types = gdf['vegflokkun_text_is']
+        road_types = road_types.map(cls.TRANSLATION_DICT).fillna(road_types)
+
+        # Road length in map units, used as the shortest-path weight
+        lengths = shapely.length(geometries).tolist()
+
+        G = cls()
+        G.add_edges_from(
+            (start_point, end_point, {
+                'geometry': geometry,
+                'road_type': road_type,
+                'length': length
+            }) for start_point, end_point, geometry, road_type, length in zip(
+                start_points, end_points, geometries, road_types, lengths))
 
         return G
 
     @property
     def road_types(self):
         """Return a list of all road types in the graph."""
-        return [
-            data.get('road_type', None) for _, _, data in self.edges(data=True)
-        ]
+        columns = self._ensure_edge_columns()
+        road_type_names = columns['road_type_names']
+        return [road_type_names[i] for i in columns['road_type_id'].tolist()]
 
     def filter_by_road_type(self, road_types):
         """Return a new RoadMap that contains only the specified road types."""
         if isinstance(road_types, str):
             road_types = [road_types]
 
-        filtered_edges = [(u, v, data) for u, v, data in self.edges(data=True)
-                          if data['road_type'] in road_types]
+        # Select edges by comparing integer road type codes
+        columns = self._ensure_edge_columns()
+        target_ids = [
+            i for i, road_type in enumerate(columns['road_type_names'])
+            if road_type in road_types
+        ]
+        mask = np.isin(columns['road_type_id'], target_ids)
+        edges = columns['edges']
 
         G_filtered = RoadMap()
+        for i in np.flatnonzero(mask):
+            u, v = edges[i]
+            G_filtered.add_edge(u, v, **self[u][v])
+
+        return G_filtered
 
-        for u, v, data in filtered_edges:
-            G_filtered.add_edge(u, v, **data)
-            G_filtered.add_node(u)
-            G_filtered.add_node(v)
+    def filter_by_bbox(self, xmin, ymin, xmax, ymax):
+        """Return a new RoadMap that contains only the roads intersecting the given bounding box."""
+        if self.number_of_edges() == 0:
+            return RoadMap()
+
+        # Candidates come from the cached STRtree, refined by exact intersection
+        tree, edges = self._ensure_spatial_index()
+        hits = tree.query(shapely.box(xmin, ymin, xmax, ymax),
+                          predicate='intersects')
+
+        G_filtered = RoadMap()
+        for i in np.sort(hits):
+            u, v = edges[i]
+            G_filtered.add_edge(u, v, **self[u][v])
 
         return G_filtered
 
     def filter_circular_paths(self):
         """Return a new RoadMap that contains only the roads that are part of circles (closed paths)."""
 
+        # An edge lies on a closed path exactly when it is not a bridge
+        bridges = set(map(frozenset, nx.bridges(self)))
+
         # Create a new empty RoadMap
         G_filtered = RoadMap()
 
-        # Identify all simple cycles (closed paths) in the graph
-        for cycle in nx.simple_cycles(self):
-            # If the cycle has more than 2 nodes, it's a valid closed path
-            if len(cycle) > 2:
-                # Create pairs of nodes to represent the edges in the cycle
-                pairs = [(cycle[i], cycle[i + 1])
-                         for i in range(len(cycle) - 1)]
-                pairs.append((cycle[-1], cycle[0]))  # Closing the loop
-
-                # Add these edges and their data to the new RoadMap
-                for u, v in pairs:
-                    if self.has_edge(u, v):
-                        data = self[u][v]
-                        G_filtered.add_edge(u, v, **data)
-                        G_filtered.add_node(u)
-                        G_filtered.add_node(v)
+        # Self-loops are not bridges but do not form a valid closed path
+        for u, v, data in self.edges(data=True):
+            if u != v and frozenset((u, v)) not in bridges:
+                G_filtered.add_edge(u, v, **data)
 
         return G_filtered
 
+    def _ensure_spatial_index(self):
+        """Return the cached (STRtree, edges) pair, building it if needed."""
+        columns = self._ensure_edge_columns()
+        if 'tree' not in columns:
+            columns['tree'] = shapely.STRtree(columns['geometries'])
+
+        return columns['tree'], columns['edges']
+
     def closest_road(self, location):
         """
         Find the closest road to the given location.
@@ -169,23 +431,18 @@ class RoadMap(nx.Graph):
 
         Returns:
         - (u, v, data): A tuple representing the start node, end node, and edge data of the closest road.
+
+        The spatial index is rebuilt after edges are added or removed; replacing
+        an edge's 'geometry' in place is not tracked.
         """
 
-        # Convert location to a Shapely Point
-        location_point = Point(location)
+        if self.number_of_edges() == 0:
+            return None
 
-        # Set an initial large value for minimum distance
-        min_distance = float('inf')
-        closest_edge = None
+        tree, edges = self._ensure_spatial_index()
+        u, v = edges[tree.nearest(Point(location))]
 
-        # Iterate over all the road geometries in the graph
-        for u, v, data in self.edges(data=True):
-            distance = location_point.distance(data['geometry'])
-            if distance < min_distance:
-                min_distance = distance
-                closest_edge = (u, v, data)
-
-        return closest_edge
+        return u, v, self[u][v]
 
     def assign_traffic_to_roads(self, gdf_traffic):
         """
@@ -193,31 +450,28 @@ class RoadMap(nx.Graph):
 
         Parameters:
         - gdf_traffic: GeoDataFrame containing traffic points with traffic columns and geometry.
+
+        If a point is equally close to several roads, any one of them may be chosen.
         """
 
         # Ensure the gdf_traffic is in the correct CRS
-        gdf_traffic = gdf_traffic.to_crs("EPSG:3857")
-
-        # Iterate over each traffic point
-        for idx, row in gdf_traffic.iterrows():
-            traffic_point_coords = row.geometry.coords[0]
-            traffic_data = {
-                'UMF_15MIN': row['UMF_15MIN'],
-                'UMF_I_DAG': row['UMF_I_DAG'],
-                'UMF_DAGUR1': row['UMF_DAGUR1'],
-                'UMF_DAGUR2': row['UMF_DAGUR2'],
-                'UMF_DAGUR3': row['UMF_DAGUR3'],
-                'UMF_DAGUR4': row['UMF_DAGUR4'],
-                'UMF_DAGUR5': row['UMF_DAGUR5'],
-                'UMF_DAGUR6': row['UMF_DAGUR6'],
-                'UMF_DAGUR7': row['UMF_DAGUR7'],
-                'coordinates': traffic_point_coords
-            }
+        gdf_traffic = _to_web_mercator(gdf_traffic)
+
+        if self.number_of_edges() == 0 or gdf_traffic.empty:
+            return
 
-            # Find the nearest road to this traffic point using the closest_road method
-            u, v, _ = self.closest_road(traffic_point_coords)
+        # Find the nearest road for all traffic points in a single query
+        tree, edges = self._ensure_spatial_index()
+        nearest = tree.nearest(gdf_traffic.geometry.values)
+        coordinates = shapely.get_coordinates(gdf_traffic.geometry.values)
+
+        records = gdf_traffic[self.TRAFFIC_COLUMNS].to_dict('records')
+        for edge_idx, traffic_data, traffic_point_coords in zip(
+                nearest, records, coordinates.tolist()):
+            traffic_data['coordinates'] = tuple(traffic_point_coords)
 
             # Update the traffic data for the nearest road
+            u, v = edges[edge_idx]
             self[u][v]['traffic'] = traffic_data
 
     def subgraph_with_only_traffic(self):
@@ -254,28 +508,23 @@ class RoadMap(nx.Graph):
                 traffic_nodes.add(u)
                 traffic_nodes.add(v)
 
-        # Calculate the shortest paths between all pairs of these nodes
-        complete_graph = nx.complete_graph(traffic_nodes)
-        for u, v in complete_graph.edges():
-            path_length = nx.shortest_path_length(self,
-                                                  source=u,
-                                                  target=v,
-                                                  weight='length')
-            complete_graph[u][v]['length'] = path_length
-
-        # Compute the Minimum Spanning Tree of this complete graph
-        mst = nx.minimum_spanning_tree(complete_graph, weight='length')
-
-        # Build the subgraph of the original graph that corresponds to this MST
-        G_sub = self.__class__()
-        for u, v in mst.edges():
-            path = nx.shortest_path(self, source=u, target=v, weight='length')
-            for i in range(len(path) - 1):
-                if not G_sub.has_edge(path[i], path[i + 1]):
-                    G_sub.add_edge(path[i], path[i + 1],
-                                   **self[path[i]][path[i + 1]])
-
-        return G_sub
+        if not traffic_nodes:
+            return self.__class__()
+
+        # Road graphs are rarely connected, so only the component holding the
+        # traffic nodes is passed on
+        component = nx.node_connected_component(
+            self, next(iter(traffic_nodes)))
+        if not traffic_nodes <= component:
+            raise nx.NetworkXNoPath(
+                "Traffic nodes lie in different connected components.")
+
+        # Kou et al.: one Dijkstra per terminal instead of one per terminal pair
+        return self.__class__(
+            steiner_tree(self.subgraph(component),
+                         traffic_nodes,
+                         weight='length',
+                         method='kou'))
 
     def draw(self,
              weather_data=None,
@@ -293,25 +542,37 @@ class RoadMap(nx.Graph):
 
         colors = plt.cm.tab20c.colors  # Using the tab20c colormap
 
-        road_types = set(data['road_type']
-                         for u, v, data in self.edges(data=True))
-        all_lines = []
-
-        for idx, road_type in enumerate(road_types):
-            translated_road_type = self.TRANSLATION_DICT.get(
-                road_type, road_type)
-            edges = [(u, v) for u, v, data in self.edges(data=True)
-                     if data['road_type'] == road_type]
-            lines = [self[u][v]['geometry'] for u, v in edges]
-
-            for line in lines:
-                xs, ys = line.xy
-                ax.plot(xs,
-                        ys,
-                        color=colors[idx % 20],
-                        label=translated_road_type,
-                        alpha=0.5)
-                all_lines.append(line)
+        # Group road geometries by translated road type, so every legend
+        # label belongs to exactly one artist
+        columns = self._ensure_edge_columns()
+        translated_road_types = [
+            self.TRANSLATION_DICT.get(road_type, road_type)
+            for road_type in columns['road_type_names']
+        ]
+        all_coords = []
+
+        for idx, translated_road_type in enumerate(
+                dict.fromkeys(translated_road_types)):
+            road_type_ids = [
+                i for i, name in enumerate(translated_road_types)
+                if name == translated_road_type
+            ]
+            lines = columns['geometries'][np.isin(columns['road_type_id'],
+                                                  road_type_ids)]
+
+            # Pull all vertices out of GEOS in one call and slice per line
+            coords = shapely.get_coordinates(lines)
+            offsets = np.cumsum(shapely.get_num_coordinates(lines))
+
+            # One artist per road type instead of one per road
+            ax.add_collection(
+                LineCollection(np.split(coords, offsets[:-1]),
+                               colors=colors[idx % 20],
+                               label=translated_road_type,
+                               alpha=0.5))
+            all_coords.append(coords)
+
+        ax.autoscale_view()
 
         if show_traffic_cameras:
             # Extract locations of traffic cameras from edges with the attribute 'traffic'
@@ -326,10 +587,11 @@ class RoadMap(nx.Graph):
                        label='Cameras')
 
         if zoom_to_extent:
-            all_coords = [point for line in all_lines for point in line.coords]
-            xs, ys = zip(*all_coords)
-            ax.set_xlim(min(xs), max(xs))
-            ax.set_ylim(min(ys), max(ys))
+            all_coords = np.concatenate(all_coords)
+            xmin, ymin = all_coords.min(axis=0)
+            xmax, ymax = all_coords.max(axis=0)
+            ax.set_xlim(xmin, xmax)
+            ax.set_ylim(ymin, ymax)
         else:
             ax.set_xlim(self.ICELAND_BOUNDS["xmin"],
                         self.ICELAND_BOUNDS["xmax"])
@@ -339,36 +601,27 @@ class RoadMap(nx.Graph):
         ctx.add_basemap(ax, source=ctx.providers.CartoDB.Positron)
         ax.set_axis_off()
 
-        handles, labels = ax.get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))
-        ax.legend(by_label.values(),
-                  by_label.keys(),
-                  title="Road Types",
-                  loc="upper left")
+        # Each road type is a single labelled artist, so no deduplication
+        ax.legend(title="Road Types", loc="upper left")
         ax.set_title(title)
 
         if weather_data and show_data:
-            # Convert weather data to a GeoDataFrame
-            gdf_weather = gpd.GeoDataFrame(
-                weather_data,
-                geometry=gpd.points_from_xy(
-                    [entry["coord"]["lon"] for entry in weather_data],
-                    [entry["coord"]["lat"] for entry in weather_data]))
-
-            # Set the original CRS and transform to EPSG:3857
-            gdf_weather.crs = "EPSG:4326"
-            gdf_weather = gdf_weather.to_crs("EPSG:3857")
-
-            # Extract transformed coordinates
-            longitudes = gdf_weather.geometry.x
-            latitudes = gdf_weather.geometry.y
+            # Reproject all stations from EPSG:4326 to EPSG:3857 in one call
+            lons = np.array([entry["coord"]["lon"] for entry in weather_data],
+                            dtype=np.float64)
+            lats = np.array([entry["coord"]["lat"] for entry in weather_data],
+                            dtype=np.float64)
+            longitudes, latitudes = _get_transformer(
+                "EPSG:4326", "EPSG:3857").transform(lons, lats)
             grid_x, grid_y = np.mgrid[self.ICELAND_BOUNDS["xmin"]:self.
                                       ICELAND_BOUNDS["xmax"]:complex(0, 100),
                                       self.ICELAND_BOUNDS["ymin"]:self.
                                       ICELAND_BOUNDS["ymax"]:complex(0, 100)]
 
             if show_data == 'temperature':
-                temperatures = gdf_weather["main"].apply(lambda x: x["temp"])
+                temperatures = np.array(
+                    [entry["main"]["temp"] for entry in weather_data],
+                    dtype=np.float64)
                 grid_temperatures = griddata((longitudes, latitudes),
                                              temperatures, (grid_x, grid_y),
                                              method='cubic')
@@ -379,7 +632,9 @@ class RoadMap(nx.Graph):
                             alpha=0.3)
 
             elif show_data == 'wind':
-                wind_speeds = gdf_weather["wind"].apply(lambda x: x["speed"])
+                wind_speeds = np.array(
+                    [entry["wind"]["speed"] for entry in weather_data],
+                    dtype=np.float64)
                 grid_wind_speeds = griddata((longitudes, latitudes),
                                             wind_speeds, (grid_x, grid_y),
                                             method='cubic')
@@ -390,13 +645,15 @@ class RoadMap(nx.Graph):
                             alpha=0.3)
 
             elif show_data == 'visibility':
-                visibilities = gdf_weather["visibility"]
+                visibilities = np.array(
+                    [entry["visibility"] for entry in weather_data],
+                    dtype=np.float64)
                 grid_visibilities = griddata((longitudes, latitudes),
                                              visibilities, (grid_x, grid_y),
                                              method='cubic')
                 # Modified the colormap for visibility
                 cmap = plt.cm.Blues_r
-                norm = plt.Normalize(vmin=min(visibilities), vmax=10000)
+                norm = plt.Normalize(vmin=visibilities.min(), vmax=10000)
                 ax.contourf(grid_x,
                             grid_y,
                             grid_visibilities,
@@ -1,16 +1,36 @@
+from functools import lru_cache
+
 import iceweather as iw
 import requests
-import json
 import numpy as np
 import cv2
 from scipy.spatial import cKDTree
 
+CAMERAS_URL = "http://gagnaveita.vegagerdin.is/api/vefmyndavelar2014_1"
+
+# Shared session so repeated requests reuse keep-alive connections
+_SESSION = requests.Session()
+
+
+@lru_cache(maxsize=1)
+def _fetch_cams():
+    """Fetch the traffic camera list once per run; return (image URLs, KD-tree of (lat, lon))."""
+    response = _SESSION.get(CAMERAS_URL)
+    response.raise_for_status()
+    site_content = response.json()
+
+    valuepic = [d['Slod'] for d in site_content]
+    points = np.array([(d['Breidd'], d['Lengd']) for d in site_content],
+                      dtype=np.float64)
+    return valuepic, cKDTree(points)
+
 
 class WeatherSensor:
 
     def __init__(self, LAT, LONG):
         self.latitude = LAT
         self.longitude = LONG
+        self.CamImg = None
 
     def get_sensor_data(self):
         Sdata = iw.observation_for_closest(self.latitude, self.longitude)
@@ -20,35 +40,22 @@ class WeatherSensor:
         self.temperature = SdataParse.get('T')
 
     def get_nearest_cam_image(self):
-        # URL of the website you want to fetch
-        url = "http://gagnaveita.vegagerdin.is/api/vefmyndavelar2014_1"
-        response = requests.get(url)
-
-        if response.status_code == 200:
-            site_content = json.loads(response.text)
-        else:
-            print(f"Failed to fetch. Status code: {response.status_code}")
-
-        valuepic = np.array([d['Slod'] for d in site_content])
-        valueslat = np.array([d['Breidd'] for d in site_content])
-        valueslong = np.array([d['Lengd'] for d in site_content])
-        points = np.hstack(valueslat.reshape(-1, 1), valueslong.reshape(-1, 1))
+        try:
+            valuepic, kdtree = _fetch_cams()
+        except requests.HTTPError as e:
+            print(f"Failed to fetch. Status code: {e.response.status_code}")
+            return
 
         Sdata = iw.observation_for_closest(self.latitude, self.longitude)
         target_point = np.array([Sdata[1]['lat'], Sdata[1]['lon']])
 
-        points = points
-        target = target_point
-        kdtree = cKDTree(points)
-        nearest_neighbor_index = kdtree.query(target_point)[1]
-        nearest_neighbor = points[nearest_neighbor_index]
-        distance = kdtree.query(target_point)[0]
+        distance, nearest_neighbor_index = kdtree.query(target_point, k=1)
 
         # URL of the image you want to download
         image_url = valuepic[nearest_neighbor_index]
 
         # Send an HTTP GET request to the image URL
-        response = requests.get(image_url)
+        response = _SESSION.get(image_url)
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
@@ -69,6 +76,6 @@ class WeatherSensor:
                 # Check if the image was loaded successfully
                 if image is not None:
                     # Display the image in a window
-                    cv2.imshow(image)
+                    cv2.imshow("cam", image)
         else:
             print("Image wasn't acquired")
@@ -1,3 +1,8 @@
+import geopandas as gpd
+import networkx as nx
+import pytest
+from shapely.geometry import LineString, MultiLineString, Point, box
+
 from rkiskaupas_datathon import RoadMap
 
 
@@ -8,3 +13,189 @@ class TestRoadMap:
 
     def test_load(self):
         assert len(self.HM.nodes()) == 200
+
+    def test_closest_road(self):
+        location = Point(-18.0354, 64.93)
+        u, v, data = self.HM.closest_road(location.coords[0])
+        assert data is self.HM[u][v]
+        assert location.distance(data['geometry']) == min(
+            location.distance(d['geometry'])
+            for _, _, d in self.HM.edges(data=True))
+
+    def test_filter_circular_paths(self):
+        G = RoadMap()
+        G.add_edges_from([((0, 0), (1, 0)), ((1, 0), (1, 1)),
+                          ((1, 1), (0, 0)), ((1, 1), (2, 2))],
+                         road_type='Main Road')
+        G_filtered = G.filter_circular_paths()
+        assert G_filtered.number_of_edges() == 3
+        assert not G_filtered.has_node((2, 2))
+
+    def test_save_load_npz(self, tmp_path):
+        filename = tmp_path / 'HM.npz'
+        self.HM.save(filename)
+        G = RoadMap.load(filename)
+        assert list(G.nodes()) == list(self.HM.nodes())
+        for u, v, data in self.HM.edges(data=True):
+            assert G[u][v]['road_type'] == data['road_type']
+            assert G[u][v]['geometry'].equals_exact(data['geometry'], 0)
+
+    def test_filter_by_road_type(self):
+        G = RoadMap()
+        G.add_edge((0, 0), (1, 0), road_type='Main Road')
+        G.add_edge((1, 0), (2, 0), road_type='Link Road')
+        G.add_edge((2, 0), (3, 0), road_type='Private Road')
+        G_filtered = G.filter_by_road_type(['Main Road', 'Link Road'])
+        assert sorted(G_filtered.road_types) == ['Link Road', 'Main Road']
+        assert G.filter_by_road_type('Private Road').has_edge((2, 0), (3, 0))
+
+    def test_filter_by_bbox(self):
+        bbox = (-19.0, 64.0, -18.0, 65.0)
+        G_filtered = self.HM.filter_by_bbox(*bbox)
+        expected = [(u, v) for u, v, data in self.HM.edges(data=True)
+                    if data['geometry'].intersects(box(*bbox))]
+        assert 0 < len(expected) < self.HM.number_of_edges()
+        assert G_filtered.number_of_edges() == len(expected)
+        assert all(G_filtered.has_edge(u, v) for u, v in expected)
+
+    def test_save_npz_after_add_node(self, tmp_path):
+        G = RoadMap()
+        G.add_edge((0, 0), (1, 0), road_type='Main Road')
+        assert G.road_types == ['Main Road']
+        G.add_node((5, 5))
+        G.save(tmp_path / 'G.npz')
+        assert RoadMap.load(tmp_path / 'G.npz').number_of_nodes() == 3
+
+    def test_save_other_extension(self, tmp_path):
+        self.HM.save(tmp_path / 'HM.bin')
+        with open(tmp_path / 'HM.bin', 'rb') as file:
+            assert file.read(1) == b'{'
+        HM = RoadMap.load(tmp_path / 'HM.bin')
+        assert len(HM.nodes) == len(self.HM.nodes)
+        assert len(HM.edges) == len(self.HM.edges)
+
+    def test_from_gdf(self):
+        gdf = gpd.GeoDataFrame(
+            {'vegflokkun_text_is': ['Stofnvegur', 'Unknown']},
+            geometry=[
+                LineString([(-18.0, 64.0), (-18.1, 64.1), (-18.2, 64.1)]),
+                MultiLineString([[(-18.2, 64.1), (-18.3, 64.2)],
+                                 [(-18.3, 64.2), (-18.0, 64.0)]])
+            ],
+            crs='EPSG:4326')
+        G = RoadMap.from_gdf(gdf)
+
+        expected = gdf.to_crs('EPSG:3857').explode(index_parts=False)
+        assert G.number_of_edges() == 3
+        for line, road_type in zip(expected.geometry,
+                                   ['Main Road', 'Unknown', 'Unknown']):
+            u, v = line.coords[0], line.coords[-1]
+            data = G[u][v]
+            assert data['geometry'].equals_exact(line, 1e-6)
+            assert data['road_type'] == road_type
+            assert data['length'] == pytest.approx(line.length)
+
+    def test_assign_traffic_to_roads(self):
+        G = RoadMap()
+        G.add_edge((0.0, 0.0), (100.0, 0.0),
+                   geometry=LineString([(0, 0), (100, 0)]),
+                   road_type='Main Road')
+        G.add_edge((0.0, 1000.0), (100.0, 1000.0),
+                   geometry=LineString([(0, 1000), (100, 1000)]),
+                   road_type='Main Road')
+        gdf_traffic = gpd.GeoDataFrame(
+            {column: [1, 2]
+             for column in RoadMap.TRAFFIC_COLUMNS},
+            geometry=[Point(50, 10), Point(50, 990)],
+            crs='EPSG:3857')
+        G.assign_traffic_to_roads(gdf_traffic)
+
+        for (u, v), value, coordinates in [
+            (((0.0, 0.0), (100.0, 0.0)), 1, (50.0, 10.0)),
+            (((0.0, 1000.0), (100.0, 1000.0)), 2, (50.0, 990.0)),
+        ]:
+            assert G[u][v]['traffic'] == {
+                **{column: value
+                   for column in RoadMap.TRAFFIC_COLUMNS},
+                'coordinates': coordinates
+            }
+
+    def test_subgraph_with_traffic(self):
+        a, b, c, d, e = (0, 0), (1, 0), (2, 0), (1, 1), (1, -1)
+        G = RoadMap()
+        G.add_edge(a, b, length=1, traffic={})
+        G.add_edge(c, d, length=1, traffic={})
+        G.add_edge(b, c, length=5)
+        G.add_edge(b, d, length=1)
+        G.add_edge(a, d, length=3)
+        G.add_edge(b, e, length=1)
+        G_sub = G.subgraph_with_traffic()
+        assert isinstance(G_sub, RoadMap)
+        assert set(map(frozenset, G_sub.edges())) == {
+            frozenset((a, b)),
+            frozenset((c, d)),
+            frozenset((b, d))
+        }
+        assert RoadMap().subgraph_with_traffic().number_of_edges() == 0
+
+    def test_subgraph_with_traffic_disconnected(self):
+        G = RoadMap()
+        G.add_edge((0, 0), (1, 0), length=1, traffic={})
+        G.add_edge((1, 0), (2, 0), length=1)
+        G.add_edge((2, 0), (3, 0), length=1, traffic={})
+        G.add_edge((10, 10), (11, 10), length=1)
+        G_sub = G.subgraph_with_traffic()
+        assert G_sub.number_of_edges() == 3
+        assert not G_sub.has_node((10, 10))
+
+        G.add_edge((10, 10), (11, 10), length=1, traffic={})
+        with pytest.raises(nx.NetworkXNoPath):
+            G.subgraph_with_traffic()
+
+    def test_save_load_json_traffic(self, tmp_path):
+        traffic = {
+            'UMF_15MIN': 12,
+            'UMF_I_DAG': float('nan'),
+            'coordinates': (0.5, 0.1)
+        }
+        G = RoadMap()
+        G.add_edge((0.0, 0.0), (1.0, 0.0),
+                   geometry=LineString([(0, 0), (1, 0)]),
+                   road_type='Main Road',
+                   traffic=traffic)
+        G.save(tmp_path / 'G.json')
+        data = RoadMap.load(tmp_path / 'G.json')[(0.0, 0.0)][(1.0, 0.0)]
+        assert data['road_type'] == 'Main Road'
+        assert data['geometry'].equals(G[(0.0, 0.0)][(1.0, 0.0)]['geometry'])
+        # NaN is written as null by orjson and comes back as None
+        assert data['traffic'] == {
+            'UMF_15MIN': 12,
+            'UMF_I_DAG': None,
+            'coordinates': [0.5, 0.1]
+        }
+
+    def test_save_load_json_3d(self, tmp_path):
+        G = RoadMap()
+        G.add_edge((0.0, 0.0), (1.0, 1.0),
+                   geometry=LineString([(0, 0, 5), (1, 1, 7)]),
+                   road_type='Main Road')
+        G.save(tmp_path / 'G.json')
+        geometry = RoadMap.load(tmp_path / 'G.json')[(0.0, 0.0)][(1.0,
+                                                                  1.0)]['geometry']
+        assert geometry.has_z
+        assert list(geometry.coords) == [(0, 0, 5), (1, 1, 7)]
+
+    def test_save_load_npz_3d(self, tmp_path):
+        G = RoadMap()
+        G.add_edge((0.0, 0.0), (1.0, 1.0),
+                   geometry=LineString([(0, 0, 5), (1, 1, 7)]),
+                   road_type='Main Road')
+        G.add_edge((1.0, 1.0), (2.0, 0.0),
+                   geometry=LineString([(1, 1), (2, 0)]),
+                   road_type='Main Road')
+        G.save(tmp_path / 'G.npz')
+        H = RoadMap.load(tmp_path / 'G.npz')
+        for u, v, data in G.edges(data=True):
+            geometry = H[u][v]['geometry']
+            assert geometry.has_z == data['geometry'].has_z
+            assert list(geometry.coords) == list(data['geometry'].coords)